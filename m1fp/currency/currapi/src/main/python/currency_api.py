@@ -10,6 +10,10 @@ It provides:
 - Amount parsing using Decimal with non-negative constraints.
 - A convert() function that calls the API, handles errors robustly, and
   returns the converted amount as Decimal.
+- convert_multi() for one source and several targets in a single request,
+  and convert_many() for a batch of independent conversions.
+- convert_async() and convert_all() for use from asyncio code; convert_all()
+  converts many pairs concurrently.
 - A command-line interface that prints a human-readable conversion line.
 
 Implementation notes:
@@ -17,19 +21,46 @@ Implementation notes:
   places using HALF_UP rounding to mirror common currency behaviour.
 - Network and API errors are mapped to IOError or ValueError with readable
   messages.
+- JSON responses are parsed with orjson when it is installed, falling back to
+  the standard library json module.
+- Exchange rates are fetched for a unit amount and cached per (FROM, TO) pair
+  for RATE_TTL_SECONDS, so repeated conversions skip the HTTP round-trip. An
+  optional redis.Redis client can be passed to convert() to share the cache
+  between processes.
 """
 import sys
-import re
-import json
+import time
+import threading
 from decimal import Decimal, InvalidOperation, ROUND_HALF_UP, getcontext
-from urllib import request, error
+
+# orjson parses the response bytes directly and is several times faster;
+# the standard library parser is used when it is not installed
+try:
+    import orjson as json
+except ImportError:
+    import json
 
 API_ENDPOINT = "https://api.frankfurter.app/latest"
 
 # Increase precision to be safe with currencies
 getcontext().prec = 28
 
-CODE_RE = re.compile(r"^[A-Za-z]{3}$")
+# Quantum for rounding amounts to 6 fractional digits, built once rather than per call
+MICRO = Decimal("0.000001")
+
+# Frankfurter publishes new rates at most once per business day
+RATE_TTL_SECONDS = 300
+
+# (FROM, TO) -> (expiry on the time.monotonic() clock, rate)
+_RATE_CACHE: dict[tuple[str, str], tuple[float, Decimal]] = {}
+
+# One keep-alive HTTPS connection per thread, so the TCP+TLS handshake is
+# paid once rather than on every call
+_LOCAL = threading.local()
+
+# Redirects are followed like urllib's urlopen does, up to the same limit
+REDIRECT_STATUSES = frozenset((301, 302, 303, 307, 308))
+MAX_REDIRECTS = 10
 
 
 def _normalize_decimal(d: Decimal) -> str:
@@ -50,8 +81,7 @@ def _normalize_decimal(d: Decimal) -> str:
         _normalize_decimal(Decimal('10.000000')) -> '10'
     """
     # Round to 6 decimal places like Java setScale(6, HALF_UP) and strip trailing zeros
-    q = Decimal("0.000001")
-    d = d.quantize(q, rounding=ROUND_HALF_UP)
+    d = d.quantize(MICRO, rounding=ROUND_HALF_UP)
     s = format(d, 'f')  # fixed-point decimal string
     if '.' in s:
         s = s.rstrip('0').rstrip('.')
@@ -67,9 +97,10 @@ def validate_currency_code(code: str) -> None:
         code: Currency code, e.g. "USD", "eur".
 
     Raises:
-        ValueError: If code is None or does not match [A-Za-z]{3}.
+        ValueError: If code is None or is not exactly three ASCII letters.
     """
-    if code is None or not CODE_RE.match(code):
+    # Plain str checks run in C and avoid the regex engine entirely
+    if code is None or len(code) != 3 or not (code.isascii() and code.isalpha()):
         raise ValueError(f"Invalid currency code: {code}")
 
 
@@ -94,64 +125,161 @@ def parse_amount(amount_str: str) -> Decimal:
     return d
 
 
-def convert(from_code: str, to_code: str, amount: Decimal, timeout: int = 15) -> Decimal:
-    """Convert an amount from one currency to another using the Frankfurter API.
+def _request_once(scheme: str, netloc: str, path: str, timeout: int) -> tuple[int, str | None, bytes]:
+    """Issue a single GET on a one-off connection to a host other than the API's.
 
-    Builds a GET request to the latest rates endpoint, validates inputs,
-    performs the HTTP call with a timeout, and parses the JSON response.
+    Only used for redirect targets; the connection is closed afterwards.
 
     Args:
-        from_code: Source currency code (e.g. "USD").
-        to_code: Target currency code (e.g. "EUR").
-        amount: Decimal amount to convert; must be non-negative.
-        timeout: Socket timeout in seconds for the HTTP call (default 15).
+        scheme: "https" or "http".
+        netloc: Host (and optional port) to connect to.
+        path: Request path including the query string.
+        timeout: Socket timeout in seconds.
 
     Returns:
-        Decimal: Converted amount as returned by the API.
+        tuple: (HTTP status code, Location header or None, raw response body).
 
     Raises:
-        ValueError: For invalid inputs or if the API returns a parseable error
-            or the response cannot be parsed into a number.
-        IOError: For HTTP status errors or network-level failures.
+        IOError: On network-level failures.
     """
-    validate_currency_code(from_code)
-    validate_currency_code(to_code)
-    if amount is None:
-        raise ValueError("amount must not be null")
+    from http import client
 
-    url = (
-        f"{API_ENDPOINT}?amount={_normalize_decimal(amount)}"
-        f"&from={from_code.upper()}&to={to_code.upper()}"
-    )
-
-    req = request.Request(url, method="GET")
+    conn_class = client.HTTPSConnection if scheme == 'https' else client.HTTPConnection
+    conn = conn_class(netloc, timeout=timeout)
     try:
-        with request.urlopen(req, timeout=timeout) as resp:
-            status = resp.getcode()
-            body = resp.read().decode('utf-8', errors='replace')
-    except error.HTTPError as e:
-        body = e.read().decode('utf-8', errors='replace')
-        # Try to parse API error message
+        conn.request("GET", path, headers={"Accept": "application/json"})
+        resp = conn.getresponse()
+        return resp.status, resp.getheader('Location'), resp.read()
+    except (OSError, client.HTTPException) as e:
+        raise IOError(f"Network error: {e}")
+    finally:
+        conn.close()
+
+
+def _request_pooled(path: str, timeout: int) -> tuple[int, str | None, bytes]:
+    """Issue a GET to the API host over the thread's persistent connection.
+
+    The connection is opened lazily and kept alive between calls. If a reused
+    connection turns out to have been closed by the server, it is reopened
+    and the request is retried once.
+
+    Args:
+        path: Request path including the query string.
+        timeout: Socket timeout in seconds.
+
+    Returns:
+        tuple: (HTTP status code, Location header or None, raw response body).
+
+    Raises:
+        IOError: On network-level failures.
+    """
+    from http import client
+    from urllib.parse import urlsplit
+
+    for attempt in range(2):
+        conn = getattr(_LOCAL, 'conn', None)
+        reused = conn is not None
+        if conn is None:
+            conn = client.HTTPSConnection(urlsplit(API_ENDPOINT).netloc, timeout=timeout)
+            _LOCAL.conn = conn
+        elif conn.sock is not None:
+            conn.sock.settimeout(timeout)
         try:
-            data = json.loads(body)
-            msg = data.get('error')
-            if isinstance(msg, str):
-                raise ValueError(f"API error: {msg}")
-        except Exception:
-            pass
-        raise IOError(f"API request failed with status {e.code}")
-    except error.URLError as e:
-        raise IOError(f"Network error: {e.reason}")
+            conn.request("GET", path, headers={"Accept": "application/json"})
+            resp = conn.getresponse()
+            # Read the body in full either way, so the connection can be reused
+            return resp.status, resp.getheader('Location'), resp.read()
+        except (client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as e:
+            conn.close()
+            _LOCAL.conn = None
+            if not reused or attempt:
+                raise IOError(f"Network error: {e}")
+        except (OSError, client.HTTPException) as e:
+            conn.close()
+            _LOCAL.conn = None
+            raise IOError(f"Network error: {e}")
+
+
+def _http_get(query: str, timeout: int) -> tuple[int, bytes]:
+    """Issue a GET to API_ENDPOINT, following redirects.
+
+    Requests to the API host go over the thread's persistent connection (see
+    _request_pooled). Redirects (301, 302, 303, 307 and 308) are followed up
+    to MAX_REDIRECTS times, as urllib's urlopen did; a redirect to another
+    host or scheme is fetched on a one-off connection.
+
+    Args:
+        query: Query string to append to API_ENDPOINT, without the "?".
+        timeout: Socket timeout in seconds.
+
+    Returns:
+        tuple: (HTTP status code, raw response body) of the final response.
+
+    Raises:
+        IOError: On network-level failures, too many redirects, or a redirect
+            to a scheme other than http or https.
+    """
+    # Imported here rather than at module level: these account for about half
+    # the import time, which CLI usage errors should not pay for
+    from urllib.parse import urljoin, urlsplit
+
+    api = urlsplit(API_ENDPOINT)
+    url = f"{API_ENDPOINT}?{query}"
+    for _ in range(MAX_REDIRECTS + 1):
+        target = urlsplit(url)
+        path = target.path or '/'
+        if target.query:
+            path += f"?{target.query}"
+        if (target.scheme, target.netloc) == (api.scheme, api.netloc):
+            status, location, body = _request_pooled(path, timeout)
+        elif target.scheme in ('http', 'https'):
+            status, location, body = _request_once(target.scheme, target.netloc, path, timeout)
+        else:
+            raise IOError(f"Network error: unsupported redirect to {url}")
+        if status not in REDIRECT_STATUSES or not location:
+            return status, body
+        url = urljoin(url, location)
+    raise IOError(f"Network error: too many redirects (more than {MAX_REDIRECTS})")
+
+
+def _fetch_rates(from_code: str, to_codes: list[str], timeout: int) -> dict[str, Decimal]:
+    """Fetch unit exchange rates for several targets with a single API request.
+
+    Uses Frankfurter's comma-separated "to" list, e.g. to=EUR,GBP,JPY.
+
+    Args:
+        from_code: Upper-case source currency code.
+        to_codes: Upper-case target currency codes.
+        timeout: Socket timeout in seconds for the HTTP call.
+
+    Returns:
+        dict: Maps each target code to the value of 1 from_code in it.
+
+    Raises:
+        ValueError: If the API returns a parseable error or the response
+            cannot be parsed into a number for every requested target.
+        IOError: For HTTP status errors or network-level failures.
+    """
+    status, raw = _http_get(f"amount=1&from={from_code}&to={','.join(to_codes)}", timeout)
 
     if status != 200:
+        # Try to parse API error message; Frankfurter reports it under "message"
+        try:
+            data = json.loads(raw)
+        except ValueError:  # JSONDecodeError or UnicodeDecodeError: no usable message
+            data = None
+        if isinstance(data, dict):
+            msg = data.get('message', data.get('error'))
+            if isinstance(msg, str):
+                raise ValueError(f"API error: {msg}")
         raise IOError(f"API request failed with status {status}")
 
     try:
-        data = json.loads(body)
-    except json.JSONDecodeError:
+        data = json.loads(raw)
+    except ValueError:  # JSONDecodeError or UnicodeDecodeError
         raise ValueError("Could not parse conversion result from API response")
 
-    # Frankfurter returns {"amount":..., "base":"USD", "date":"...", "rates": {"EUR": 1.2345}}
+    # Frankfurter returns {"amount":..., "base":"USD", "date":"...", "rates": {"EUR": 1.2345, ...}}
     if isinstance(data, dict) and 'error' in data and isinstance(data['error'], str):
         raise ValueError(f"API error: {data['error']}")
 
@@ -159,15 +287,261 @@ def convert(from_code: str, to_code: str, amount: Decimal, timeout: int = 15) ->
     if not isinstance(rates, dict):
         raise ValueError("Could not parse conversion result from API response")
 
-    key = to_code.upper()
-    val = rates.get(key)
-    if val is None:
-        raise ValueError("Could not parse conversion result from API response")
+    result = {}
+    for to_code in to_codes:
+        val = rates.get(to_code)
+        if val is None:
+            raise ValueError("Could not parse conversion result from API response")
+        try:
+            result[to_code] = Decimal(str(val))
+        except (InvalidOperation, ValueError):
+            raise ValueError("Could not parse conversion result from API response")
+    return result
 
-    try:
-        return Decimal(str(val))
-    except (InvalidOperation, ValueError):
-        raise ValueError("Could not parse conversion result from API response")
+
+def _get_rates(from_code: str, to_codes: list[str], timeout: int,
+               redis_client=None) -> dict[str, Decimal]:
+    """Return from_code -> to_code rates, using the TTL cache when possible.
+
+    The in-process cache is consulted first. Targets that miss are looked up
+    in the shared Redis cache (if a client is given) under the key
+    "rate:{FROM}:{TO}", and whatever is still missing is fetched from the API
+    in one request. Fetched rates are stored in both caches for
+    RATE_TTL_SECONDS. Redis errors and unparsable stored values are treated
+    as cache misses, so only the API can raise.
+
+    Args:
+        from_code: Upper-case source currency code.
+        to_codes: Upper-case target currency codes, without duplicates.
+        timeout: Socket timeout in seconds for the HTTP call.
+        redis_client: Optional redis.Redis client used as a shared cache.
+
+    Returns:
+        dict: Maps each target code to its exchange rate.
+    """
+    now = time.monotonic()
+    rates = {}
+    missing = []
+    for to_code in to_codes:
+        cached = _RATE_CACHE.get((from_code, to_code))
+        if cached is not None and cached[0] > now:
+            rates[to_code] = cached[1]
+        else:
+            missing.append(to_code)
+    if not missing:
+        return rates
+
+    fetched = {}
+    if redis_client is not None:
+        keys = [f"rate:{from_code}:{to_code}" for to_code in missing]
+        try:
+            stored = redis_client.mget(keys)
+        except Exception:
+            # The shared cache is optional: if Redis is unreachable, fall through to the API
+            stored = [None] * len(keys)
+        for to_code, raw in zip(missing, stored):
+            if raw is None:
+                continue
+            try:
+                rate = Decimal(raw.decode('ascii') if isinstance(raw, bytes) else raw)
+            except (InvalidOperation, ValueError):
+                continue  # A corrupt entry counts as a miss and is overwritten below
+            if rate.is_finite():
+                fetched[to_code] = rate
+        missing = [to_code for to_code in missing if to_code not in fetched]
+
+    if missing:
+        from_api = _fetch_rates(from_code, missing, timeout)
+        if redis_client is not None:
+            try:
+                for to_code, rate in from_api.items():
+                    redis_client.setex(f"rate:{from_code}:{to_code}", RATE_TTL_SECONDS, str(rate))
+            except Exception:
+                pass  # Failing to share the rates must not lose them; they still go in the local cache
+        fetched.update(from_api)
+
+    for to_code, rate in fetched.items():
+        _RATE_CACHE[(from_code, to_code)] = (now + RATE_TTL_SECONDS, rate)
+    rates.update(fetched)
+    return rates
+
+
+def convert_multi(from_code: str, to_codes: list[str], amount: Decimal, timeout: int = 15,
+                  redis_client=None) -> dict[str, Decimal]:
+    """Convert an amount from one currency into several others.
+
+    All uncached rates are fetched with a single API request, and the
+    conversions are computed locally, rounded to 6 fractional digits with
+    HALF_UP. Zero amounts and same-currency targets are answered without any
+    lookup.
+
+    Args:
+        from_code: Source currency code (e.g. "USD").
+        to_codes: Target currency codes (e.g. ["EUR", "GBP"]).
+        amount: Decimal amount to convert; must be non-negative.
+        timeout: Socket timeout in seconds for the HTTP call (default 15).
+        redis_client: Optional redis.Redis client used to share cached rates
+            between processes.
+
+    Returns:
+        dict: Maps each upper-case target code to the converted amount.
+
+    Raises:
+        ValueError: For invalid inputs or if the API returns a parseable error
+            or the response cannot be parsed into a number.
+        IOError: For HTTP status errors or network-level failures.
+    """
+    validate_currency_code(from_code)
+    for to_code in to_codes:
+        validate_currency_code(to_code)
+    if amount is None:
+        raise ValueError("amount must not be null")
+
+    from_code = from_code.upper()
+    targets = list(dict.fromkeys(code.upper() for code in to_codes))
+
+    # Trivial conversions need no rate at all
+    same = amount.quantize(MICRO, rounding=ROUND_HALF_UP)
+    if amount == 0:
+        return dict.fromkeys(targets, same)
+    lookup = [code for code in targets if code != from_code]
+    rates = _get_rates(from_code, lookup, timeout, redis_client) if lookup else {}
+
+    return {
+        code: (amount * rates[code]).quantize(MICRO, rounding=ROUND_HALF_UP)
+        if code != from_code else same
+        for code in targets
+    }
+
+
+def convert(from_code: str, to_code: str, amount: Decimal, timeout: int = 15,
+            redis_client=None) -> Decimal:
+    """Convert an amount from one currency to another using the Frankfurter API.
+
+    Validates inputs, looks up the exchange rate (from the cache or via the
+    API) and multiplies it locally, rounding the result to 6 fractional
+    digits with HALF_UP. Zero amounts and same-currency conversions are
+    answered without any lookup. This is convert_multi() with one target.
+
+    Args:
+        from_code: Source currency code (e.g. "USD").
+        to_code: Target currency code (e.g. "EUR").
+        amount: Decimal amount to convert; must be non-negative.
+        timeout: Socket timeout in seconds for the HTTP call (default 15).
+        redis_client: Optional redis.Redis client used to share cached rates
+            between processes.
+
+    Returns:
+        Decimal: Converted amount.
+
+    Raises:
+        ValueError: For invalid inputs or if the API returns a parseable error
+            or the response cannot be parsed into a number.
+        IOError: For HTTP status errors or network-level failures.
+    """
+    return convert_multi(from_code, [to_code], amount, timeout, redis_client)[to_code.upper()]
+
+
+def convert_many(pairs, timeout: int = 15, redis_client=None) -> list[Decimal]:
+    """Convert a batch of amounts, reusing the cache and the open connection.
+
+    Rates are prefetched with one request per distinct source currency.
+
+    Args:
+        pairs: Iterable of (from_code, to_code, amount) tuples.
+        timeout: Socket timeout in seconds for each HTTP call (default 15).
+        redis_client: Optional redis.Redis client used as a shared cache.
+
+    Returns:
+        list[Decimal]: Converted amounts, in input order.
+
+    Raises:
+        ValueError, IOError: As for convert(); the first failure aborts the batch.
+    """
+    pairs = list(pairs)
+
+    # Prefetch all rates with one request per source currency; the
+    # conversions below are then served from the cache
+    targets_by_source = {}
+    for from_code, to_code, _ in pairs:
+        validate_currency_code(from_code)
+        validate_currency_code(to_code)
+        if from_code.upper() != to_code.upper():
+            targets_by_source.setdefault(from_code.upper(), {})[to_code.upper()] = None
+    for from_code, targets in targets_by_source.items():
+        _get_rates(from_code, list(targets), timeout, redis_client)
+
+    return [convert(from_code, to_code, amount, timeout, redis_client)
+            for from_code, to_code, amount in pairs]
+
+
+async def convert_async(from_code: str, to_code: str, amount: Decimal, timeout: int = 15,
+                        redis_client=None) -> Decimal:
+    """Asynchronous convert(): runs the lookup in a worker thread.
+
+    Each worker thread keeps its own keep-alive connection, so concurrent
+    calls do not serialize on a single socket.
+
+    Args:
+        from_code: Source currency code (e.g. "USD").
+        to_code: Target currency code (e.g. "EUR").
+        amount: Decimal amount to convert; must be non-negative.
+        timeout: Socket timeout in seconds for the HTTP call (default 15).
+        redis_client: Optional redis.Redis client used as a shared cache.
+
+    Returns:
+        Decimal: Converted amount.
+
+    Raises:
+        ValueError, IOError: As for convert().
+    """
+    import asyncio
+
+    return await asyncio.to_thread(convert, from_code, to_code, amount, timeout, redis_client)
+
+
+async def convert_all(pairs, amount: Decimal, timeout: int = 15, redis_client=None,
+                      max_concurrency: int = 20) -> list[Decimal]:
+    """Convert one amount across many currency pairs concurrently.
+
+    Pairs are grouped by source currency, and each group is answered by one
+    convert_multi() call. The groups run concurrently in worker threads, at
+    most max_concurrency at a time, so a cross-rate table costs roughly one
+    round-trip instead of one per pair.
+
+    Args:
+        pairs: Iterable of (from_code, to_code) tuples.
+        amount: Decimal amount to convert; must be non-negative.
+        timeout: Socket timeout in seconds for each HTTP call (default 15).
+        redis_client: Optional redis.Redis client used as a shared cache.
+        max_concurrency: Maximum number of requests in flight (default 20).
+
+    Returns:
+        list[Decimal]: Converted amounts, in input order.
+
+    Raises:
+        ValueError, IOError: As for convert(); the first failure is raised.
+    """
+    import asyncio
+
+    pairs = list(pairs)
+    targets_by_source = {}
+    for from_code, to_code in pairs:
+        validate_currency_code(from_code)
+        validate_currency_code(to_code)
+        targets_by_source.setdefault(from_code.upper(), {})[to_code.upper()] = None
+
+    limit = asyncio.Semaphore(max_concurrency)
+
+    async def convert_group(from_code, to_codes):
+        async with limit:
+            return from_code, await asyncio.to_thread(
+                convert_multi, from_code, to_codes, amount, timeout, redis_client)
+
+    groups = await asyncio.gather(*(convert_group(from_code, list(targets))
+                                    for from_code, targets in targets_by_source.items()))
+    results = dict(groups)
+    return [results[from_code.upper()][to_code.upper()] for from_code, to_code in pairs]
 
 
 def main(argv):
@@ -0,0 +1,195 @@
+# test_currency_api.py
+
+import os
+import sys
+import asyncio
+import unittest
+from decimal import Decimal
+from http import client
+from unittest import mock
+
+# currency_api.py lives in the parent directory and is not installed
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import currency_api
+from currency_api import RATE_TTL_SECONDS, MAX_REDIRECTS
+
+
+def rates_body(base, rates):
+    # A Frankfurter-style JSON response for amount=1
+    pairs = ','.join(f'"{code}":{rate}' for code, rate in rates.items())
+    return f'{{"amount":1.0,"base":"{base}","date":"2024-01-02","rates":{{{pairs}}}}}'.encode()
+
+
+class FakeResponse:
+    def __init__(self, status, body, location=None):
+        self.status = status
+        self.body = body
+        self.location = location
+
+    def getheader(self, name):
+        return self.location if name == 'Location' else None
+
+    def read(self):
+        return self.body
+
+
+class FakeConnection:
+    # Stands in for http.client.HTTPSConnection; fails with error on request if one is given
+    def __init__(self, *args, error=None, response=None, **kwargs):
+        self.error = error
+        self.response = response
+        self.sock = None
+        self.requests = []
+        self.closed = False
+
+    def request(self, method, path, headers=None):
+        self.requests.append(path)
+        if self.error is not None:
+            raise self.error
+
+    def getresponse(self):
+        return self.response
+
+    def close(self):
+        self.closed = True
+
+
+class TestCurrencyApi(unittest.TestCase):
+    def setUp(self):
+        # Every test starts from empty caches and no open connection
+        currency_api._RATE_CACHE.clear()
+        currency_api._LOCAL.conn = None
+        self.paths = []
+        self.responses = []
+
+    def tearDown(self):
+        currency_api._RATE_CACHE.clear()
+        currency_api._LOCAL.conn = None
+
+    def request_pooled(self, path, timeout):
+        # Replaces _request_pooled: records the path and returns the next queued response
+        self.paths.append(path)
+        return self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+
+    def stub_api(self, *responses):
+        self.responses = list(responses)
+        patcher = mock.patch.object(currency_api, '_request_pooled', side_effect=self.request_pooled)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def stub_rates(self, base, rates):
+        self.stub_api((200, None, rates_body(base, rates)))
+
+    def test_convert(self):
+        self.stub_rates('USD', {'EUR': 0.9})
+        self.assertEqual(currency_api.convert('usd', 'eur', Decimal('10')), Decimal('9.000000'))
+        self.assertEqual(self.paths, ['/latest?amount=1&from=USD&to=EUR'])
+
+    def test_cache_hit(self):
+        self.stub_rates('USD', {'EUR': 0.9})
+        currency_api.convert('USD', 'EUR', Decimal('10'))
+        self.assertEqual(currency_api.convert('USD', 'EUR', Decimal('20')), Decimal('18.000000'))
+        self.assertEqual(len(self.paths), 1)
+
+    def test_cache_expiry(self):
+        self.stub_rates('USD', {'EUR': 0.9})
+        with mock.patch.object(currency_api.time, 'monotonic', return_value=1000.0):
+            currency_api.convert('USD', 'EUR', Decimal('10'))
+        with mock.patch.object(currency_api.time, 'monotonic', return_value=1000.0 + RATE_TTL_SECONDS - 1):
+            currency_api.convert('USD', 'EUR', Decimal('10'))
+        self.assertEqual(len(self.paths), 1)
+        with mock.patch.object(currency_api.time, 'monotonic', return_value=1000.0 + RATE_TTL_SECONDS):
+            currency_api.convert('USD', 'EUR', Decimal('10'))
+        self.assertEqual(len(self.paths), 2)
+
+    def test_fast_paths(self):
+        # Same-currency and zero conversions need no request at all
+        self.stub_rates('USD', {'EUR': 0.9})
+        self.assertEqual(currency_api.convert('usd', 'USD', Decimal('1.2345678')), Decimal('1.234568'))
+        self.assertEqual(currency_api.convert('USD', 'EUR', Decimal('0')), Decimal('0.000000'))
+        self.assertEqual(currency_api.convert_multi('USD', ['USD', 'usd'], Decimal('5')),
+                         {'USD': Decimal('5.000000')})
+        self.assertEqual(self.paths, [])
+
+    def test_convert_multi_deduplicates(self):
+        self.stub_rates('USD', {'EUR': 0.9, 'GBP': 0.8})
+        result = currency_api.convert_multi('USD', ['eur', 'EUR', 'GBP', 'USD'], Decimal('10'))
+        self.assertEqual(result, {'EUR': Decimal('9.000000'), 'GBP': Decimal('8.000000'),
+                                  'USD': Decimal('10.000000')})
+        self.assertEqual(self.paths, ['/latest?amount=1&from=USD&to=EUR,GBP'])
+
+    def test_api_error_message(self):
+        self.stub_api((404, None, b'{"message":"not found"}'))
+        with self.assertRaisesRegex(ValueError, 'API error: not found'):
+            currency_api.convert('USD', 'XXX', Decimal('1'))
+
+    def test_api_error_without_message(self):
+        self.stub_api((500, None, b'<html>oops</html>'))
+        with self.assertRaisesRegex(IOError, 'status 500'):
+            currency_api.convert('USD', 'EUR', Decimal('1'))
+
+    def test_redirect(self):
+        self.stub_api((301, '/v1/latest?amount=1&from=USD&to=EUR', b''),
+                      (200, None, rates_body('USD', {'EUR': 0.9})))
+        self.assertEqual(currency_api.convert('USD', 'EUR', Decimal('10')), Decimal('9.000000'))
+        self.assertEqual(self.paths, ['/latest?amount=1&from=USD&to=EUR',
+                                      '/v1/latest?amount=1&from=USD&to=EUR'])
+
+    def test_redirect_to_other_host(self):
+        self.stub_api((302, 'https://mirror.example.com/latest?amount=1&from=USD&to=EUR', b''))
+        with mock.patch.object(currency_api, '_request_once',
+                               return_value=(200, None, rates_body('USD', {'EUR': 0.9}))) as request_once:
+            self.assertEqual(currency_api.convert('USD', 'EUR', Decimal('10')), Decimal('9.000000'))
+        request_once.assert_called_once_with('https', 'mirror.example.com',
+                                             '/latest?amount=1&from=USD&to=EUR', 15)
+
+    def test_redirect_loop(self):
+        self.stub_api((302, '/latest?amount=1&from=USD&to=EUR', b''))
+        with self.assertRaisesRegex(IOError, 'too many redirects'):
+            currency_api.convert('USD', 'EUR', Decimal('1'))
+        self.assertEqual(len(self.paths), MAX_REDIRECTS + 1)
+
+    def test_redirect_to_unsupported_scheme(self):
+        self.stub_api((302, 'ftp://example.com/rates', b''))
+        with self.assertRaisesRegex(IOError, 'unsupported redirect'):
+            currency_api.convert('USD', 'EUR', Decimal('1'))
+
+    def test_reconnect_once(self):
+        # A kept-alive connection closed by the server is reopened and the request retried
+        stale = FakeConnection(error=client.RemoteDisconnected('closed'))
+        fresh = FakeConnection(response=FakeResponse(200, rates_body('USD', {'EUR': 0.9})))
+        currency_api._LOCAL.conn = stale
+        with mock.patch.object(client, 'HTTPSConnection', return_value=fresh):
+            self.assertEqual(currency_api.convert('USD', 'EUR', Decimal('10')), Decimal('9.000000'))
+        self.assertTrue(stale.closed)
+        self.assertEqual(fresh.requests, ['/latest?amount=1&from=USD&to=EUR'])
+        self.assertIs(currency_api._LOCAL.conn, fresh)
+
+    def test_reconnect_failure(self):
+        # The retry happens once only, and not at all on a fresh connection
+        stale = FakeConnection(error=client.RemoteDisconnected('closed'))
+        fresh = FakeConnection(error=client.RemoteDisconnected('closed'))
+        currency_api._LOCAL.conn = stale
+        with mock.patch.object(client, 'HTTPSConnection', return_value=fresh) as connection_class:
+            with self.assertRaisesRegex(IOError, 'Network error'):
+                currency_api.convert('USD', 'EUR', Decimal('1'))
+        self.assertEqual(connection_class.call_count, 1)
+        self.assertEqual(len(fresh.requests), 1)
+        self.assertIsNone(currency_api._LOCAL.conn)
+
+    def test_convert_all_groups_by_source(self):
+        self.stub_api((200, None, rates_body('USD', {'EUR': 0.9, 'GBP': 0.8})),
+                      (200, None, rates_body('EUR', {'USD': 1.1})))
+        # One request per source currency; the EUR group is issued after the USD group
+        result = asyncio.run(currency_api.convert_all(
+            [('USD', 'EUR'), ('usd', 'gbp'), ('EUR', 'USD'), ('USD', 'EUR')], Decimal('10'),
+            max_concurrency=1))
+        self.assertEqual(result, [Decimal('9.000000'), Decimal('8.000000'),
+                                  Decimal('11.000000'), Decimal('9.000000')])
+        self.assertEqual(self.paths, ['/latest?amount=1&from=USD&to=EUR,GBP',
+                                      '/latest?amount=1&from=EUR&to=USD'])
+
+
+if __name__ == '__main__':
+    unittest.main()
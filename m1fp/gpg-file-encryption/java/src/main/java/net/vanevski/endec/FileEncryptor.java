@@ -1,14 +1,19 @@
 /**
- * A utility class for file encryption using AES-256-CBC with PBKDF2 key derivation.
+ * A utility class for file encryption using AES-256-GCM with PBKDF2 key derivation.
  * 
  * This class provides functionality to encrypt files using:
- * - AES-256 encryption in CBC mode with PKCS5 padding
+ * - AES-256 authenticated encryption in GCM mode (no padding)
  * - PBKDF2 with HMAC-SHA256 for key derivation from a passphrase
  * - Email address as salt for the key derivation
  * - Secure random IV generation
  * 
- * The encrypted file format prepends a 16-byte IV to the encrypted data.
- * The encryption process uses streams for memory-efficient handling of large files.
+ * The encrypted file format is a 12-byte IV, the encrypted data and a 16-byte
+ * authentication tag, matching the Python implementation.
+ * Encryption streams the file through the cipher, so its memory use does not grow with the file size.
+ * Decryption does not: the JDK's GCM implementation (SunJCE) releases no plaintext until the
+ * authentication tag has been verified, so it buffers the whole file in memory. Decrypting a file
+ * therefore needs a heap larger than the file, and files over about 2 GB (the maximum Java array
+ * size) cannot be decrypted by this class; use the Python implementation for those.
  * 
  * Usage example:
  *      FileEncryptor encryptor = new FileEncryptor();
@@ -30,6 +35,7 @@
 
 package net.vanevski.endec;
 
+import java.io.File;
 import java.io.FileInputStream;
 import java.io.FileOutputStream;
 import java.io.IOException;
@@ -39,21 +45,25 @@ import java.security.spec.KeySpec;
 import java.util.Scanner;
 
 import javax.crypto.Cipher;
-import javax.crypto.CipherOutputStream;
 import javax.crypto.SecretKey;
 import javax.crypto.SecretKeyFactory;
-import javax.crypto.spec.IvParameterSpec;
+import javax.crypto.spec.GCMParameterSpec;
 import javax.crypto.spec.PBEKeySpec;
 import javax.crypto.spec.SecretKeySpec;
 
 
 public class FileEncryptor {
 
+    // GCM uses a 96-bit IV and a 128-bit authentication tag
+    private static final int IV_LENGTH = 12;
+    private static final int TAG_LENGTH_BITS = 128;
+
     /**
-     * Encrypts a file using AES-256 in CBC mode with PKCS5 padding.
+     * Encrypts a file using AES-256 in GCM mode.
      * The encryption key is derived from the provided passphrase using PBKDF2 with HMAC-SHA256.
      * The email address is used as a salt for the key derivation.
-     * The IV is randomly generated and prepended to the encrypted file.
+     * The IV is randomly generated and prepended to the encrypted file; the
+     * authentication tag is appended after the encrypted data.
      *
      * @param inputFilePath  path to the input file to be encrypted
      * @param outputFilePath path where the encrypted file will be written
@@ -77,27 +87,30 @@ public class FileEncryptor {
             SecretKeySpec secretKey = new SecretKeySpec(tmp.getEncoded(), "AES");
 
             // Generate random IV
-            byte[] iv = new byte[16];
+            byte[] iv = new byte[IV_LENGTH];
             SecureRandom random = new SecureRandom();
             random.nextBytes(iv);
-            IvParameterSpec ivSpec = new IvParameterSpec(iv);
+            GCMParameterSpec gcmSpec = new GCMParameterSpec(TAG_LENGTH_BITS, iv);
 
             // Initialize cipher
-            Cipher cipher = Cipher.getInstance("AES/CBC/PKCS5Padding");
-            cipher.init(Cipher.ENCRYPT_MODE, secretKey, ivSpec);
+            Cipher cipher = Cipher.getInstance("AES/GCM/NoPadding");
+            cipher.init(Cipher.ENCRYPT_MODE, secretKey, gcmSpec);
 
-            // Stream input -> cipher -> output; write IV as the first 16 bytes of the output file
+            // Stream input -> cipher -> output; write IV as the first 12 bytes of the output file.
+            // doFinal() emits the remaining data followed by the authentication tag.
             try (FileInputStream fis = new FileInputStream(inputFilePath);
                  FileOutputStream fos = new FileOutputStream(outputFilePath)) {
 
                 fos.write(iv); // prepend IV
-                try (CipherOutputStream cos = new CipherOutputStream(fos, cipher)) {
-                    byte[] buffer = new byte[4096];
-                    int n;
-                    while ((n = fis.read(buffer)) != -1) {
-                        cos.write(buffer, 0, n);
+                byte[] buffer = new byte[4096];
+                int n;
+                while ((n = fis.read(buffer)) != -1) {
+                    byte[] out = cipher.update(buffer, 0, n);
+                    if (out != null) {
+                        fos.write(out);
                     }
                 }
+                fos.write(cipher.doFinal());
             }
             return System.currentTimeMillis() - startTime;
         } catch (IOException e) {
@@ -109,10 +122,15 @@ public class FileEncryptor {
     }
 
     /**
-     * Decrypts a file that was encrypted using AES-256 in CBC mode with PKCS5 padding.
+     * Decrypts a file that was encrypted using AES-256 in GCM mode.
      * The decryption key is derived from the provided passphrase using PBKDF2 with HMAC-SHA256.
      * The email address is used as a salt for the key derivation.
-     * The IV is read from the first 16 bytes of the encrypted file.
+     * The IV is read from the first 12 bytes of the encrypted file and the
+     * authentication tag is verified when decryption completes.
+     * The cipher buffers the whole file and only releases the plaintext once the tag has been
+     * verified, so memory use grows with the file size (see the class documentation).
+     * If decryption fails (e.g. wrong passphrase or tampered file), the output file is deleted,
+     * matching the Python implementation.
      *
      * @param inputFilePath  path to the encrypted input file
      * @param outputFilePath path where the decrypted file will be written
@@ -127,6 +145,7 @@ public class FileEncryptor {
      */
     public long decryptFile(String inputFilePath, String outputFilePath, String email, char[] passphrase) {
         long startTime = System.currentTimeMillis();
+        boolean outputCreated = false;
         try {
             // Derive AES key from passphrase using PBKDF2 with HMAC-SHA256
             byte[] salt = (email != null) ? email.getBytes(StandardCharsets.UTF_8) : new byte[8];
@@ -135,26 +154,32 @@ public class FileEncryptor {
             SecretKey tmp = factory.generateSecret(spec);
             SecretKeySpec secretKey = new SecretKeySpec(tmp.getEncoded(), "AES");
 
-            // Read IV from the first 16 bytes of encrypted file
+            // Read IV from the first 12 bytes of encrypted file
             try (FileInputStream fis = new FileInputStream(inputFilePath)) {
-                byte[] iv = new byte[16];
-                if (fis.read(iv) != 16) {
+                byte[] iv = new byte[IV_LENGTH];
+                if (fis.read(iv) != IV_LENGTH) {
                     throw new IOException("Invalid encrypted file format");
                 }
-                IvParameterSpec ivSpec = new IvParameterSpec(iv);
+                GCMParameterSpec gcmSpec = new GCMParameterSpec(TAG_LENGTH_BITS, iv);
 
                 // Initialize cipher for decryption
-                Cipher cipher = Cipher.getInstance("AES/CBC/PKCS5Padding");
-                cipher.init(Cipher.DECRYPT_MODE, secretKey, ivSpec);
+                Cipher cipher = Cipher.getInstance("AES/GCM/NoPadding");
+                cipher.init(Cipher.DECRYPT_MODE, secretKey, gcmSpec);
 
-                // Stream encrypted input -> cipher -> output
-                try (FileOutputStream fos = new FileOutputStream(outputFilePath);
-                     CipherOutputStream cos = new CipherOutputStream(fos, cipher)) {
+                // Feed encrypted input -> cipher -> output.
+                // doFinal() verifies the trailing tag and throws AEADBadTagException on mismatch;
+                // until then the cipher buffers the data and update() returns nothing.
+                try (FileOutputStream fos = new FileOutputStream(outputFilePath)) {
+                    outputCreated = true;
                     byte[] buffer = new byte[4096];
                     int n;
                     while ((n = fis.read(buffer)) != -1) {
-                        cos.write(buffer, 0, n);
+                        byte[] out = cipher.update(buffer, 0, n);
+                        if (out != null) {
+                            fos.write(out);
+                        }
                     }
+                    fos.write(cipher.doFinal());
                 }
             }
             return System.currentTimeMillis() - startTime;
@@ -163,6 +188,10 @@ public class FileEncryptor {
         } catch (Exception e) {
             System.err.println("Decryption error: " + e.getMessage());
         }
+        // Never leave an empty or partial output file behind
+        if (outputCreated && !new File(outputFilePath).delete()) {
+            System.err.println("Could not delete incomplete output file: " + outputFilePath);
+        }
         return -1L;
     }
 
@@ -1,27 +1,194 @@
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.backends import default_backend
-import secrets
+# The cryptography and secrets imports are deferred into the functions that use them, so that
+# --help and argument errors do not pay for loading the library
 import os
 import argparse
 import sys
 import getpass
 import time
+import functools
+import contextlib
+import mmap
+import shutil
+import stat
+import tempfile
 
+# Files are streamed through the cipher in chunks of this size
+CHUNK_SIZE = 1 << 20
 
-"""A class for encrypting and decrypting files using AES encryption in CBC mode.
-This class handles file encryption and decryption using AES-256 with CBC mode and PKCS7 padding.
-The encryption key is derived from a user-provided passphrase and email using PBKDF2-HMAC-SHA256.
+# Buffer size for the output file objects; larger buffers mean fewer write syscalls.
+# Input files are memory-mapped instead of read into buffers.
+IO_BUFFER_SIZE = 1 << 22
+
+# GCM uses a 96-bit IV and appends a 128-bit authentication tag
+IV_SIZE = 12
+TAG_SIZE = 16
+
+# Supported key derivation functions. PBKDF2 is the default because it is the only
+# one the Java implementation supports; scrypt is memory-hard and therefore costs an
+# attacker far more per guess for the same defender CPU time.
+KDF_PBKDF2 = "pbkdf2"
+KDF_SCRYPT = "scrypt"
+KDF_CHOICES = (KDF_PBKDF2, KDF_SCRYPT)
+
+# scrypt cost parameters (N=2^14, r=8 uses 16 MB of memory per derivation)
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+
+
+"""
+Derives a 32-byte AES key from a passphrase using PBKDF2-HMAC-SHA256 or scrypt.
+The result is memoized per (email, passphrase, kdf) triple, so repeated encrypt and
+decrypt calls with the same credentials skip the expensive derivation.
+Args:
+    email (str): The email address, used as the salt
+    passphrase (str): The passphrase to derive the key from
+    kdf (str): KDF_PBKDF2 (65536 iterations) or KDF_SCRYPT
+Returns:
+    bytes: A 32-byte derived key suitable for AES encryption
+Raises:
+    ValueError: If kdf is not one of KDF_CHOICES
+Note:
+    The PBKDF2 parameters are specifically chosen to match the Java implementation for compatibility.
+"""
+@functools.lru_cache(maxsize=32)
+def _derive_key_cached(email, passphrase, kdf=KDF_PBKDF2):
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+    from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
+    from cryptography.hazmat.backends import default_backend
+
+    # Use email as salt (matching Java implementation)
+    salt = email.encode('utf-8')
+
+    if kdf == KDF_PBKDF2:
+        # Create key using PBKDF2 with HMAC-SHA256 (matching Java parameters)
+        derivation = PBKDF2HMAC(
+            algorithm=hashes.SHA256(),
+            length=32,  # 256 bits
+            salt=salt,
+            iterations=65536,
+            backend=default_backend()
+        )
+    elif kdf == KDF_SCRYPT:
+        derivation = Scrypt(
+            salt=salt,
+            length=32,  # 256 bits
+            n=SCRYPT_N,
+            r=SCRYPT_R,
+            p=SCRYPT_P,
+            backend=default_backend()
+        )
+    else:
+        raise ValueError(f"Unsupported key derivation function: {kdf}")
+    return derivation.derive(passphrase.encode('utf-8'))
+
+
+"""
+Maps an open file read-only into memory and yields a memoryview over its contents.
+Slices of the view are passed straight to the cipher, so the data goes from the page
+cache to OpenSSL without being copied into Python bytes objects first.
+Only regular files can be mapped; pipes, FIFOs and terminals (e.g. /dev/stdin) report a
+size of 0 whatever they contain, so for those None is yielded and the caller reads the
+file in CHUNK_SIZE pieces instead (see _read_chunks).
+Args:
+    f_in: A file object opened in binary read mode
+Yields:
+    memoryview: The file contents (an empty view for an empty file, which cannot be mapped),
+    or None if the file is not a regular file
+Note:
+    Slices taken from the view must not outlive the with block, or unmapping fails.
+    The mapped file must not be truncated while it is mapped (see _open_output).
+"""
+@contextlib.contextmanager
+def _map_file(f_in):
+    st = os.fstat(f_in.fileno())
+    if not stat.S_ISREG(st.st_mode):
+        yield None
+        return
+    if st.st_size == 0:
+        yield memoryview(b'')
+        return
+    with mmap.mmap(f_in.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        view = memoryview(mm)
+        try:
+            yield view
+        finally:
+            view.release()
+
+
+"""
+Reads a file that cannot be memory-mapped in CHUNK_SIZE pieces until end of file.
+Args:
+    f_in: A file object opened in binary read mode
+Returns:
+    iterator: The successive chunks, as bytes
+"""
+def _read_chunks(f_in):
+    return iter(functools.partial(f_in.read, CHUNK_SIZE), b'')
+
+
+"""
+Tells whether two paths name the same regular file, i.e. an in-place encryption or decryption.
+Args:
+    input_file (str): Path to the input file
+    output_file (str): Path to the output file, which may not exist yet
+Returns:
+    bool: True if both paths refer to the same regular file
+"""
+def _is_same_regular_file(input_file, output_file):
+    try:
+        return os.path.samefile(input_file, output_file) and stat.S_ISREG(os.stat(input_file).st_mode)
+    except OSError:
+        return False
+
+
+"""
+Opens the output file for writing and yields the buffered file object.
+When the output is the input file itself, opening it for writing would truncate the data
+before it has been read, so in that case the output goes to a temporary file in the same
+directory, which replaces the input (keeping its permissions) once it is complete.
+If an error occurs, the partial output is removed; an existing file replaced in place is
+left untouched.
+Args:
+    input_file (str): Path to the input file
+    output_file (str): Path where the output should be saved
+Yields:
+    A binary file object opened for writing
+"""
+@contextlib.contextmanager
+def _open_output(input_file, output_file):
+    in_place = _is_same_regular_file(input_file, output_file)
+    if in_place:
+        fd, path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(output_file)))
+        f_out = open(fd, 'wb', buffering=IO_BUFFER_SIZE)
+    else:
+        path = output_file
+        f_out = open(output_file, 'wb', buffering=IO_BUFFER_SIZE)
+    try:
+        with f_out:
+            yield f_out
+    except BaseException:
+        if os.path.isfile(path):
+            os.remove(path)
+        raise
+    if in_place:
+        shutil.copymode(output_file, path)
+        os.replace(path, output_file)
+
+
+"""A class for encrypting and decrypting files using AES encryption in GCM mode.
+This class handles authenticated file encryption and decryption using AES-256 with GCM mode.
+The encryption key is derived from a user-provided passphrase and email using PBKDF2-HMAC-SHA256
+(default) or scrypt.
 Attributes:
     email (str): The email address used as salt for key derivation
     passphrase (str): The passphrase used to generate the encryption key
+    kdf (str): The key derivation function, KDF_PBKDF2 or KDF_SCRYPT
 Methods:
-    encrypt_file(input_file, output_file): Encrypts a file using AES-256-CBC
-    decrypt_file(input_file, output_file): Decrypts a file encrypted with this class
-    _derive_key(): Derives encryption key from passphrase and email using PBKDF2
-    _pad_data(data): Applies PKCS7 padding to data
-    _unpad_data(data): Removes PKCS7 padding from data
+    encrypt_file(input_file, output_file): Encrypts a file using AES-256-GCM
+    decrypt_file(input_file, output_file): Decrypts and authenticates a file encrypted with this class
+    _derive_key(): Derives encryption key from passphrase and email using the configured KDF
 Example:
     encryptor = FileEncryptor("user@example.com", "mypassphrase")
     encryptor.encrypt_file("plaintext.txt", "encrypted.bin")
@@ -29,20 +196,29 @@ Example:
 Note:
     The email address is used as the salt for key derivation, ensuring consistent
     key generation across different implementations when using the same email/passphrase.
+    Files encrypted with KDF_SCRYPT can only be decrypted with KDF_SCRYPT, and only by
+    the Python implementation.
 """
 class FileEncryptor:
-    def __init__(self, email, passphrase):
+    def __init__(self, email, passphrase, kdf=KDF_PBKDF2):
         # Initialize the FileEncryptor with the user's email and passphrase
+        if kdf not in KDF_CHOICES:
+            raise ValueError(f"Unsupported key derivation function: {kdf}")
         self.email = email
         self.passphrase = passphrase
+        self.kdf = kdf
+        self._key = None
 
     """
-    Derives an encryption key from the user's passphrase using PBKDF2 (Password-Based Key Derivation Function 2).
-    The method uses the following parameters:
+    Derives an encryption key from the user's passphrase using the configured KDF.
+    With KDF_PBKDF2 (Password-Based Key Derivation Function 2) the method uses:
     - HMAC-SHA256 as the hash function
     - User's email as the salt value
     - 65536 iterations
     - 32 bytes (256 bits) key length
+    With KDF_SCRYPT it uses the email as salt and N=2^14, r=8, p=1.
+    The key is derived once and kept on the instance; instances sharing the same
+    credentials also share the module-level cache in _derive_key_cached.
     Returns:
         bytes: A 32-byte derived key suitable for AES encryption
     Note:
@@ -50,95 +226,98 @@ class FileEncryptor:
         The parameters are specifically chosen to match the Java implementation for compatibility.
     """
     def _derive_key(self):
-        # Use email as salt (matching Java implementation)
-        salt = self.email.encode('utf-8')
-        
-        # Create key using PBKDF2 with HMAC-SHA256 (matching Java parameters)
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,  # 256 bits
-            salt=salt,
-            iterations=65536,
-            backend=default_backend()
-        )
-        key = kdf.derive(self.passphrase.encode('utf-8'))
-        return key
+        if self._key is None:
+            self._key = _derive_key_cached(self.email, self.passphrase, self.kdf)
+        return self._key
 
     """
     Decrypts a file that was previously encrypted using the encrypt_file method.
     This method performs the following operations:
-    1. Derives the encryption key from the passphrase using PBKDF2
-    2. Reads the IV (Initialization Vector) from the first 16 bytes of the encrypted file
-    3. Creates an AES cipher in CBC mode using the derived key and IV
-    4. Decrypts the data and removes PKCS7 padding
-    5. Writes the decrypted data to the output file
+    1. Derives the encryption key from the passphrase using the configured KDF
+    2. Reads the IV (Initialization Vector) from the first 12 bytes and the
+       authentication tag from the last 16 bytes of the encrypted file
+    3. Creates an AES cipher in GCM mode using the derived key and IV
+    4. Memory-maps the input (or, for pipes and other non-regular files, reads it) and streams
+       the ciphertext between them through the cipher in CHUNK_SIZE pieces, writing the
+       decrypted data to the output file as it goes
+    5. Verifies the authentication tag; if it does not match, the partially
+       written output file is removed
+    The output may be the input file itself; it is then replaced only after a successful decryption.
     Args:
         input_file (str): Path to the encrypted file to be decrypted
         output_file (str): Path where the decrypted file should be saved
+    Returns:
         int: Time taken to decrypt in milliseconds
     Raises:
-        Exception: If any error occurs during the decryption process
-        The decryption process uses AES-256 in CBC mode and expects PKCS7 padding.
+        Exception: If any error occurs during the decryption process, including a
+        wrong passphrase or a tampered file (authentication tag mismatch).
         The file format must match the one produced by encrypt_file method.
 
     """
     def decrypt_file(self, input_file, output_file):
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+        from cryptography.hazmat.backends import default_backend
+        from cryptography.exceptions import InvalidTag
+
         start_time = time.perf_counter()
         try:
             key = self._derive_key()
 
-            # Read IV and encrypted data from file
-            with open(input_file, 'rb') as f_in:
-                iv = f_in.read(16)  # First 16 bytes are IV
-                encrypted_data = f_in.read()
-
-            # Create AES cipher in CBC mode
-            cipher = Cipher(
-                algorithms.AES(key),
-                modes.CBC(iv),
-                backend=default_backend()
-            )
-            decryptor = cipher.decryptor()
-
-            # Decrypt the data and remove padding
-            decrypted_data = decryptor.update(encrypted_data) + decryptor.finalize()
-            unpadded_data = self._unpad_data(decrypted_data)
-
-            # Write decrypted data to output file
-            with open(output_file, 'wb') as f_out:
-                f_out.write(unpadded_data)
+            with open(input_file, 'rb') as f_in, _map_file(f_in) as data:
+                if data is None:
+                    # Not a regular file: the tag is only known once the whole input has been read
+                    iv = f_in.read(IV_SIZE)
+                    tag = None
+                else:
+                    end = len(data) - TAG_SIZE
+                    if end < IV_SIZE:
+                        raise ValueError("Invalid encrypted file format")
+                    iv = bytes(data[:IV_SIZE])  # First 12 bytes are IV
+                    tag = bytes(data[end:])  # Last 16 bytes are the tag
+                if len(iv) < IV_SIZE:
+                    raise ValueError("Invalid encrypted file format")
+
+                # Create AES cipher in GCM mode
+                cipher = Cipher(
+                    algorithms.AES(key),
+                    modes.GCM(iv, tag),
+                    backend=default_backend()
+                )
+                decryptor = cipher.decryptor()
+
+                # Decrypt the ciphertext between the IV and the tag.
+                # On failure the partial output is removed, so unauthenticated plaintext is never left behind.
+                with _open_output(input_file, output_file) as f_out:
+                    if data is None:
+                        # Hold back the last TAG_SIZE bytes read so far: at end of file they are the tag
+                        tail = b''
+                        for chunk in _read_chunks(f_in):
+                            chunk = tail + chunk
+                            f_out.write(decryptor.update(chunk[:-TAG_SIZE]))
+                            tail = chunk[-TAG_SIZE:]
+                        if len(tail) < TAG_SIZE:
+                            raise ValueError("Invalid encrypted file format")
+                        f_out.write(decryptor.finalize_with_tag(tail))  # Raises InvalidTag on mismatch
+                    else:
+                        for offset in range(IV_SIZE, end, CHUNK_SIZE):
+                            f_out.write(decryptor.update(data[offset:min(offset + CHUNK_SIZE, end)]))
+                        f_out.write(decryptor.finalize())  # Raises InvalidTag on mismatch
 
             print(f"File '{input_file}' decrypted successfully to '{output_file}'.")
             return int((time.perf_counter() - start_time) * 1000)  # Return time in milliseconds
 
         except Exception as e:
+            if isinstance(e, InvalidTag):
+                e = "authentication failed (wrong passphrase or corrupted file)"
             raise Exception(f"Decryption failed: {str(e)}")
 
-
-    """
-    Removes PKCS#7 padding from the decrypted data.
-
-    This method is required because block ciphers operate on fixed-size blocks (e.g., 16 bytes for AES). 
-    When encrypting data that isn't a multiple of the block size, padding is added to reach the required length.
-    After decryption, this padding needs to be removed to restore the original data.
-
-    Args:
-        data (bytes): The decrypted data with padding
-
-    Returns:
-        bytes: The original data with padding removed
-
-    Example:
-        If the last byte is 0x04, it indicates 4 bytes of padding were added,
-        so the method removes the last 4 bytes from the data.
-    """
-    def _unpad_data(self, data):
-        padding_length = data[-1]
-        return data[:-padding_length]
-        
-    """Encrypts a file using AES-256 in CBC mode with PKCS7 padding.
-    This method reads the input file, encrypts its contents using a key derived from
-    the passphrase, and writes the encrypted data along with the IV to the output file.
+    """Encrypts a file using AES-256 in GCM mode.
+    This method memory-maps the input file (or reads it, if it is a pipe or another
+    non-regular file) and streams it through the cipher in CHUNK_SIZE pieces using a key
+    derived from the passphrase, and writes the IV, the encrypted data and the GCM
+    authentication tag to the output file. GCM needs no padding, so memory use does not
+    grow with the file size. The output may be the input file itself; it is then replaced
+    once the encrypted file is complete.
     Args:
         input_file (str): Path to the file to be encrypted
         output_file (str): Path where the encrypted file will be saved
@@ -148,38 +327,43 @@ class FileEncryptor:
         Exception: If encryption fails for any reason (file I/O, encryption process, etc.)
     Note:
         The output file format consists of:
-        - First 16 bytes: Initialization Vector (IV)
-        - Remaining bytes: Encrypted data with PKCS7 padding
+        - First 12 bytes: Initialization Vector (IV)
+        - Following bytes: Encrypted data (same length as the input)
+        - Last 16 bytes: GCM authentication tag
     """
     def encrypt_file(self, input_file, output_file):
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+        from cryptography.hazmat.backends import default_backend
+        import secrets
+
         start_time = time.perf_counter()
         try:
             # Generate key from passphrase
             key = self._derive_key()
             
-            # Generate random IV (16 bytes for AES)
-            iv = secrets.token_bytes(16)
+            # Generate random IV (12 bytes, as recommended for GCM)
+            iv = secrets.token_bytes(IV_SIZE)
             
-            # Create AES cipher in CBC mode with PKCS7 padding
+            # Create AES cipher in GCM mode
             cipher = Cipher(
                 algorithms.AES(key),
-                modes.CBC(iv),
+                modes.GCM(iv),
                 backend=default_backend()
             )
             encryptor = cipher.encryptor()
 
-            # Read input file and encrypt
-            with open(input_file, 'rb') as f_in:
-                file_data = f_in.read()
-                
-            # Encrypt the data
-            padded_data = self._pad_data(file_data)
-            encrypted_data = encryptor.update(padded_data) + encryptor.finalize()
-
-            # Write IV and encrypted data to output file
-            with open(output_file, 'wb') as f_out:
-                f_out.write(iv)  # Write IV first (16 bytes)
-                f_out.write(encrypted_data)
+            with open(input_file, 'rb') as f_in, _map_file(f_in) as data, \
+                    _open_output(input_file, output_file) as f_out:
+                f_out.write(iv)  # Write IV first (12 bytes)
+                if data is None:
+                    # Not a regular file (e.g. a pipe): read it in chunks instead
+                    for chunk in _read_chunks(f_in):
+                        f_out.write(encryptor.update(chunk))
+                else:
+                    for offset in range(0, len(data), CHUNK_SIZE):
+                        f_out.write(encryptor.update(data[offset:offset + CHUNK_SIZE]))
+                f_out.write(encryptor.finalize())
+                f_out.write(encryptor.tag)  # Append the 16-byte authentication tag
 
             print(f"File '{input_file}' encrypted successfully to '{output_file}'.")
             return int((time.perf_counter() - start_time) * 1000)  # Return time in milliseconds
@@ -187,49 +371,26 @@ class FileEncryptor:
         except Exception as e:
             raise Exception(f"Encryption failed: {str(e)}")
 
-    """
-    Applies PKCS7 padding to the input data for AES encryption.
-
-    PKCS7 padding ensures the data length is a multiple of the block size by
-    adding padding bytes. The value of each padding byte is equal to the 
-    number of padding bytes added.
-
-    Args:
-        data (bytes): The data to be padded
-
-    Returns:
-        bytes: The padded data with PKCS7 padding applied
-
-    Example:
-        If block_size is 16 and data length is 10, 6 padding bytes each with
-        value 6 will be added, resulting in a 16-byte output.
-    """
-    def _pad_data(self, data):
-        # PKCS7 padding
-        block_size = algorithms.AES.block_size // 8
-        padding_length = block_size - (len(data) % block_size)
-        padding = bytes([padding_length] * padding_length)
-        return data + padding
-
 
 """Parse command line arguments for file encryption/decryption.
 
 This function sets up and processes command line arguments for the file encryption tool.
-It handles the operation type (encrypt/decrypt), email address, and file paths.
+It handles the operation type (encrypt/decrypt), email address, file paths and key derivation function.
 
 Args:
     argv (list, optional): List of command line arguments. Defaults to None,
         in which case sys.argv[1:] is used.
 
 Returns:
-    tuple: A 4-element tuple containing:
+    tuple: A 5-element tuple containing:
         - operation (str): The operation to perform ('encrypt' or 'decrypt')
         - email (str): The recipient's email address
         - input_file (str): Path to the input file
         - output_file (str): Path for the output file
+        - kdf (str): The key derivation function ('pbkdf2' or 'scrypt')
 
 Example:
-    >>> operation, email, in_file, out_file = parse_args(['encrypt', 'user@example.com',
+    >>> operation, email, in_file, out_file, kdf = parse_args(['encrypt', 'user@example.com',
         '-i', 'input.txt', '-o', 'output.enc'])
 """
 def parse_args(argv=None):
@@ -240,8 +401,10 @@ def parse_args(argv=None):
     parser.add_argument("email", help="Recipient email address (positional, no flag)")
     parser.add_argument("-i", "--input", dest="input_file", required=True, help="Path to the file to encrypt")
     parser.add_argument("-o", "--output", dest="output_file", required=True, help="Path to save the encrypted file")
+    parser.add_argument("--kdf", choices=KDF_CHOICES, default=KDF_PBKDF2,
+                        help="Key derivation function (default: pbkdf2, compatible with the Java tool)")
     args = parser.parse_args(argv)
-    return args.operation, args.email, args.input_file, args.output_file
+    return args.operation, args.email, args.input_file, args.output_file, args.kdf
 
 
 def main(argv=None):
@@ -265,7 +428,7 @@ def main(argv=None):
         after use for security purposes.
     """
     try:
-        operation, email, input_file, output_file = parse_args(argv)
+        operation, email, input_file, output_file, kdf = parse_args(argv)
     except SystemExit:
         # argparse already printed help or error to stderr; re-raise to exit with its code
         raise
@@ -274,7 +437,7 @@ def main(argv=None):
     passphrase = getpass.getpass(prompt="Enter your passphrase: ")
 
     try:
-        encryptor = FileEncryptor(email, passphrase)
+        encryptor = FileEncryptor(email, passphrase, kdf)
         if operation == "encrypt":
             eltime = encryptor.encrypt_file(input_file, output_file)
             print(f"Encryption completed in {eltime} ms.")
@@ -0,0 +1,159 @@
+# test_aes_file_encryptor.py
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import contextlib
+import io
+import threading
+
+# The encryptor package lives in ../src and is not installed
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from encryptor.file_encryptor import (FileEncryptor, CHUNK_SIZE, IV_SIZE, TAG_SIZE,
+                                      KDF_SCRYPT)
+
+EMAIL = 'test@example.com'
+PASSPHRASE = 'testpass'
+
+
+class TestAesFileEncryptor(unittest.TestCase):
+    def setUp(self):
+        # Work in a temporary directory, removed after each test
+        self.test_dir = tempfile.mkdtemp()
+        self.plain_path = self.path('plain.bin')
+        self.encrypted_path = self.path('encrypted.bin')
+        self.decrypted_path = self.path('decrypted.bin')
+        self.encryptor = FileEncryptor(EMAIL, PASSPHRASE)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def path(self, name):
+        return os.path.join(self.test_dir, name)
+
+    def write_plain(self, size):
+        data = os.urandom(size)
+        with open(self.plain_path, 'wb') as f:
+            f.write(data)
+        return data
+
+    def read(self, path):
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def run_quietly(self, method, *args):
+        # The encryptor prints a message on success
+        with contextlib.redirect_stdout(io.StringIO()):
+            return method(*args)
+
+    def encrypt(self, encryptor=None):
+        encryptor = encryptor or self.encryptor
+        return self.run_quietly(encryptor.encrypt_file, self.plain_path, self.encrypted_path)
+
+    def decrypt(self, encryptor=None):
+        encryptor = encryptor or self.encryptor
+        return self.run_quietly(encryptor.decrypt_file, self.encrypted_path, self.decrypted_path)
+
+    def test_round_trip(self):
+        # Empty, single byte, exactly one chunk and one byte past a chunk boundary
+        for size in (0, 1, CHUNK_SIZE, CHUNK_SIZE + 1):
+            with self.subTest(size=size):
+                data = self.write_plain(size)
+                self.encrypt()
+                self.decrypt()
+                self.assertEqual(self.read(self.decrypted_path), data)
+
+    def test_encrypted_size(self):
+        # The IV and the tag are the only overhead (GCM needs no padding)
+        for size in (0, 1, CHUNK_SIZE + 1):
+            with self.subTest(size=size):
+                self.write_plain(size)
+                self.encrypt()
+                self.assertEqual(os.path.getsize(self.encrypted_path), size + 28)
+
+    def test_tampered_file(self):
+        self.write_plain(1000)
+        self.encrypt()
+        encrypted = bytearray(self.read(self.encrypted_path))
+        encrypted[IV_SIZE + 10] ^= 0x01  # Flip one bit of the ciphertext
+        with open(self.encrypted_path, 'wb') as f:
+            f.write(encrypted)
+
+        with self.assertRaisesRegex(Exception, 'authentication failed'):
+            self.decrypt()
+        # No unauthenticated plaintext left behind
+        self.assertFalse(os.path.exists(self.decrypted_path))
+
+    def test_wrong_passphrase(self):
+        self.write_plain(1000)
+        self.encrypt()
+        with self.assertRaisesRegex(Exception, 'authentication failed'):
+            self.decrypt(FileEncryptor(EMAIL, 'wrongpass'))
+        self.assertFalse(os.path.exists(self.decrypted_path))
+
+    def test_too_short_file(self):
+        with open(self.encrypted_path, 'wb') as f:
+            f.write(b'x' * (IV_SIZE + TAG_SIZE - 1))
+        with self.assertRaisesRegex(Exception, 'Invalid encrypted file format'):
+            self.decrypt()
+
+    def test_scrypt_round_trip(self):
+        encryptor = FileEncryptor(EMAIL, PASSPHRASE, kdf=KDF_SCRYPT)
+        data = self.write_plain(CHUNK_SIZE + 1)
+        self.encrypt(encryptor)
+        self.decrypt(encryptor)
+        self.assertEqual(self.read(self.decrypted_path), data)
+        # A scrypt key cannot decrypt with the default PBKDF2 key
+        with self.assertRaisesRegex(Exception, 'authentication failed'):
+            self.decrypt()
+
+    def test_in_place(self):
+        data = self.write_plain(CHUNK_SIZE + 1)
+        self.run_quietly(self.encryptor.encrypt_file, self.plain_path, self.plain_path)
+        self.assertEqual(os.path.getsize(self.plain_path), len(data) + IV_SIZE + TAG_SIZE)
+        self.run_quietly(self.encryptor.decrypt_file, self.plain_path, self.plain_path)
+        self.assertEqual(self.read(self.plain_path), data)
+        # No temporary files left in the directory
+        self.assertEqual(os.listdir(self.test_dir), ['plain.bin'])
+
+    def test_in_place_failure_keeps_input(self):
+        self.write_plain(1000)
+        self.run_quietly(self.encryptor.encrypt_file, self.plain_path, self.plain_path)
+        encrypted = self.read(self.plain_path)
+        with self.assertRaisesRegex(Exception, 'authentication failed'):
+            FileEncryptor(EMAIL, 'wrongpass').decrypt_file(self.plain_path, self.plain_path)
+        self.assertEqual(self.read(self.plain_path), encrypted)
+        self.assertEqual(os.listdir(self.test_dir), ['plain.bin'])
+
+    def run_from_pipe(self, method, content, output_file):
+        # Feed content through a named pipe from another thread while method reads it
+        fifo_path = self.path('fifo')
+        os.mkfifo(fifo_path)
+
+        def feed():
+            with open(fifo_path, 'wb') as f:
+                f.write(content)
+
+        writer = threading.Thread(target=feed)
+        writer.start()
+        try:
+            self.run_quietly(method, fifo_path, output_file)
+        finally:
+            writer.join()
+            os.remove(fifo_path)
+
+    @unittest.skipUnless(hasattr(os, 'mkfifo'), 'requires named pipes')
+    def test_pipe_input(self):
+        # Pipes report a size of 0, so they are read in chunks instead of memory-mapped
+        data = os.urandom(CHUNK_SIZE + 1)
+        self.run_from_pipe(self.encryptor.encrypt_file, data, self.encrypted_path)
+        self.assertEqual(os.path.getsize(self.encrypted_path), len(data) + 28)
+        self.run_from_pipe(self.encryptor.decrypt_file, self.read(self.encrypted_path), self.decrypted_path)
+        self.assertEqual(self.read(self.decrypted_path), data)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,9 +5,12 @@ import gnupg
 import unittest
 
 class TestFileEncryptor(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Initialize the GPG instance once; constructing it spawns the gpg binary
+        cls.gpg = gnupg.GPG()
+
     def setUp(self):
-        # Initialize the GPG instance
-        self.gpg = gnupg.GPG()
         # Create a temporary file for testing
         self.test_file_path = 'test_file.txt'
         with open(self.test_file_path, 'w') as f:
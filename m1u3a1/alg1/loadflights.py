@@ -1,11 +1,56 @@
 import csv
+import functools
+import sys
+import numpy as np
+import pandas as pd
 from flightresult import FlightResult
 
+COLUMNS = ['outgoing_flight_number', 'origin_airport', 'destination_airport',
+           'layover_airport', 'duration', 'price']
+# The fields FlightResult.generateKey combines, in the same order
+KEY_COLUMNS = ['origin_airport', 'layover_airport', 'destination_airport', 'duration']
+
+@functools.lru_cache(maxsize=None)
+def parse_duration(text):
+    """Converts a duration such as '10H35M', '4H' or '45M' into whole minutes."""
+    hours, sep, minutes = text.partition('H')
+    if not sep:
+        # Under an hour: minutes only
+        hours, minutes = '0', text
+    minutes = minutes.rstrip('M')
+    return int(hours) * 60 + (int(minutes) if minutes else 0)
+
 def load_flights(csv_path):
     results = []
     with open(csv_path, newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
+        # Plain rows and positional arguments avoid building a dict per record
+        reader = csv.reader(csvfile)
+        header = next(reader)
+        positions = [header.index(column) for column in COLUMNS]
+        number, origin, destination, layover, duration, price = positions
+        # Airport codes come from a small set: intern them so all records share one string per code
+        intern = sys.intern
         for row in reader:
-            flight = FlightResult(**row)
+            # Convert once here so the selectors compare numbers, not strings
+            flight = FlightResult(row[number], intern(row[origin]), intern(row[destination]),
+                                  intern(row[layover]), parse_duration(row[duration]), float(row[price]))
             results.append(flight)
-    return results
\ No newline at end of file
+    return results
+
+def load_flights_df(csv_path):
+    """
+    Loads the flights CSV into a pandas DataFrame using the C parser, for the
+    vectorized selectors. Airports are read as categoricals (integer codes),
+    duration is converted to whole minutes, so grouping by KEY_COLUMNS matches
+    FlightResult.generateKey.
+    Fields are kept as read, like csv.reader does in load_flights: empty or
+    'NA' values stay strings rather than becoming NaN.
+    """
+    df = pd.read_csv(csv_path, usecols=COLUMNS, keep_default_na=False, dtype={
+        'outgoing_flight_number': 'str', 'origin_airport': 'category',
+        'destination_airport': 'category', 'layover_airport': 'category',
+        'duration': 'str', 'price': 'float64'})
+    # Only a handful of distinct durations: parse each once
+    codes, durations = pd.factorize(df['duration'])
+    df['duration'] = np.array([parse_duration(d) for d in durations], dtype='int32')[codes]
+    return df
@@ -0,0 +1,218 @@
+import time
+import sys
+import numpy as np
+from loadflights import KEY_COLUMNS, load_flights, load_flights_df
+
+try:
+    from numba import njit, prange
+except ImportError:
+    # Without Numba the kernels below run as plain Python: same results, just slower
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+    prange = range
+
+# Number of records each selector is run on once before timing
+WARM_UP_SIZE = 1000
+
+
+def select_lowest_price_flights(flight_results):
+    """
+    Given a list of FlightResult records, returns a new list containing only the lowest price record for each unique key.
+    Also returns the number of nanoseconds elapsed during the operation, measured with time.perf_counter_ns().
+    Assumes FlightResult has 'key' and 'price' attributes.
+    This version uses a quadratic scan and does not use maps.
+    Each record is compared only with the ones after it, and records already matched to an earlier key are
+    flagged as processed so they are skipped by the outer loop.
+    """
+    start_time = time.perf_counter_ns()
+    result_list = []
+    n = len(flight_results)
+    processed = np.zeros(n, dtype=bool)
+
+    for i in range(n):
+        if processed[i]:
+            continue
+
+        # First record with this key: no earlier record shares it, so only look ahead
+        lowest_record = flight_results[i]
+        key = lowest_record.key
+        for j in range(i + 1, n):
+            other = flight_results[j]
+            if other.key == key:
+                processed[j] = True
+                if other.price < lowest_record.price:
+                    lowest_record = other
+        result_list.append(lowest_record)
+
+    elapsed_ns = time.perf_counter_ns() - start_time
+    return result_list, elapsed_ns
+
+
+def select_lowest_price_flights_map(flight_results):
+    """
+    Given a list of FlightResult records, returns a new list containing only the lowest price record for each unique key.
+    Also returns the number of nanoseconds elapsed during the operation, measured with time.perf_counter_ns().
+    This version uses a map (dictionary) for efficient lookup.
+    Assumes FlightResult has 'key' and 'price' attributes.
+    """
+    start_time = time.perf_counter_ns()
+    lowest_price_map = {}
+
+    for record in flight_results:
+        key = record.key
+        if key not in lowest_price_map or record.price < lowest_price_map[key].price:
+            lowest_price_map[key] = record
+
+    result_list = list(lowest_price_map.values())
+    elapsed_ns = time.perf_counter_ns() - start_time
+    return result_list, elapsed_ns
+
+
+def select_lowest_price_flights_sort_sweep(flight_results):
+    """
+    Given a list of FlightResult records, returns a new list containing only the lowest price record for each unique key.
+    Also returns the number of nanoseconds elapsed during the operation, measured with time.perf_counter_ns().
+    This version uses a sort-and-sweep algorithm.
+    Assumes FlightResult has 'key' and 'price' attributes.
+    """
+    start_time = time.perf_counter_ns()
+
+    sorted_flights = sorted(flight_results, key=lambda r: r.key)
+    result_list = []
+    prev_key = None
+    lowest_record = None
+
+    for record in sorted_flights:
+        if record.key != prev_key:
+            if lowest_record is not None:
+                result_list.append(lowest_record)
+            lowest_record = record
+            prev_key = record.key
+        else:
+            if record.price < lowest_record.price:
+                lowest_record = record
+    if lowest_record is not None:
+        result_list.append(lowest_record)
+
+    elapsed_ns = time.perf_counter_ns() - start_time
+    return result_list, elapsed_ns
+
+
+def select_lowest_price_flights_pandas(df):
+    """
+    Given a DataFrame of flight records (see load_flights_df), returns a new DataFrame containing only the lowest
+    price row for each unique key.
+    Also returns the number of nanoseconds elapsed during the operation, measured with time.perf_counter_ns().
+    This version uses a vectorized pandas groupby with idxmin, so the per-key minimum is computed in C.
+    Assumes the DataFrame has the KEY_COLUMNS and 'price' columns.
+    """
+    start_time = time.perf_counter_ns()
+
+    idx = df.groupby(KEY_COLUMNS, sort=False, observed=True, dropna=False)['price'].idxmin()
+    result_df = df.loc[idx]
+
+    elapsed_ns = time.perf_counter_ns() - start_time
+    return result_df, elapsed_ns
+
+
+@njit(parallel=True, cache=True)
+def _segment_argmin(prices, starts, ends):
+    """
+    Parallel per-key min reduction over structure-of-arrays input.
+    Given prices sorted by key and the [start, end) bounds of each run of equal keys, returns the position of the
+    lowest price entry of each run. Runs are independent, so they are reduced in parallel with prange.
+    """
+    selected = np.empty(len(starts), dtype=np.int64)
+    for s in prange(len(starts)):
+        selected[s] = starts[s] + np.argmin(prices[starts[s]:ends[s]])
+    return selected
+
+
+def select_lowest_price_flights_numba(df):
+    """
+    Given a DataFrame of flight records (see load_flights_df), returns a new DataFrame containing only the lowest
+    price row for each unique key.
+    Also returns the number of nanoseconds elapsed during the operation, measured with time.perf_counter_ns().
+    This version encodes the keys as integers, sorts them with numpy, splits the sorted arrays into per-key segments
+    and reduces each segment in a parallel Numba-compiled loop.
+    Assumes the DataFrame has the KEY_COLUMNS and 'price' columns.
+    """
+    start_time = time.perf_counter_ns()
+
+    # With no rows there are no segments to reduce
+    if len(df) == 0:
+        return df.iloc[[]], time.perf_counter_ns() - start_time
+
+    keys = df.groupby(KEY_COLUMNS, sort=False, observed=True, dropna=False).ngroup().to_numpy()
+    prices = df['price'].to_numpy(dtype=np.float64)
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    boundaries = np.flatnonzero(np.diff(sorted_keys)) + 1
+    starts = np.concatenate(([0], boundaries))
+    ends = np.concatenate((boundaries, [len(sorted_keys)]))
+    selected = _segment_argmin(prices[order], starts, ends)
+    result_df = df.iloc[order[selected]]
+
+    elapsed_ns = time.perf_counter_ns() - start_time
+    return result_df, elapsed_ns
+
+
+def lowest_prices(result):
+    """
+    Given the result of any of the selectors above (a list of FlightResult records or a DataFrame), returns a
+    dictionary mapping each key, as a tuple of the KEY_COLUMNS fields, to its selected price.
+    Used to check that all selectors agree.
+    """
+    if isinstance(result, list):
+        return {tuple(getattr(record, column) for column in KEY_COLUMNS): record.price for record in result}
+    return dict(zip(result[KEY_COLUMNS].itertuples(index=False, name=None), result['price']))
+
+
+def main():
+    if len(sys.argv) != 2:
+        print("Usage: python selectflights.py <filename>")
+        return
+
+    filename = sys.argv[1]
+    flight_results = load_flights(filename)
+    print(f"Loaded {len(flight_results)} flight records from {filename}")
+    flights_df = load_flights_df(filename)
+
+    # Run every selector once on a small slice first, so one-off costs
+    # (imports, Numba compilation or cache loading) are not timed
+    for select in (select_lowest_price_flights, select_lowest_price_flights_sort_sweep,
+                   select_lowest_price_flights_map):
+        select(flight_results[:WARM_UP_SIZE])
+    for select in (select_lowest_price_flights_pandas, select_lowest_price_flights_numba):
+        select(flights_df.head(WARM_UP_SIZE))
+
+    result_quad, elapsed_ns_quad = select_lowest_price_flights(flight_results)
+    print(f"Quadratic scan execution time: {elapsed_ns_quad / 1e6:.3f} ms")
+    print(f"Number of unique flights (quadratic): {len(result_quad)}")
+
+    result_sort, elapsed_ns_sort = select_lowest_price_flights_sort_sweep(flight_results)
+    print(f"Sort-and-sweep execution time: {elapsed_ns_sort / 1e6:.3f} ms")
+    print(f"Number of unique flights (sort-and-sweep): {len(result_sort)}")
+
+    result_map, elapsed_ns_map = select_lowest_price_flights_map(flight_results)
+    print(f"Map execution time: {elapsed_ns_map / 1e6:.3f} ms")
+    print(f"Number of unique flights (map): {len(result_map)}")
+
+    result_pandas, elapsed_ns_pandas = select_lowest_price_flights_pandas(flights_df)
+    print(f"Pandas groupby execution time: {elapsed_ns_pandas / 1e6:.3f} ms")
+    print(f"Number of unique flights (pandas): {len(result_pandas)}")
+
+    result_numba, elapsed_ns_numba = select_lowest_price_flights_numba(flights_df)
+    print(f"Numba sort-and-sweep execution time: {elapsed_ns_numba / 1e6:.3f} ms")
+    print(f"Number of unique flights (numba): {len(result_numba)}")
+
+    # Every selector must pick the same lowest price for every key
+    expected = lowest_prices(result_map)
+    for result in (result_quad, result_sort, result_pandas, result_numba):
+        assert lowest_prices(result) == expected, "Selectors disagree on the lowest price flights"
+    print("All selectors agree")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
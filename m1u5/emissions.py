@@ -3,6 +3,12 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns 
 
+# Columns needed downstream and their parse types.
+# Emissions stay float64: values reach 9 significant digits, beyond float32 precision.
+EMISSIONS_COLUMN = 'Total annual CO₂ emissions from aviation'
+DATA_COLUMNS = ['Entity', 'Code', 'Year', EMISSIONS_COLUMN]
+DATA_DTYPES = {'Year': 'int32', EMISSIONS_COLUMN: 'float64', 'Code': 'category'}
+
 ### 
 # Aviation Emissions Analysis Script
 # This script analyzes and visualizes aviation CO₂ emissions data from a CSV file.
@@ -38,6 +44,7 @@ def loadData(filePath):
     """
     Reads a CSV file containing aviation emissions data and returns a pandas DataFrame.
 
+    Only the needed columns are parsed, with compact types for 'Year' and 'Code'.
     The function renames columns for clarity:
         - 'Entity' is renamed to 'Country'
         - 'Annual CO₂ emissions from aviation (million tonnes)' is renamed to 'Emissions'
@@ -48,11 +55,11 @@ def loadData(filePath):
     Returns:
         pandas.DataFrame: DataFrame with renamed columns.
     """
-    df = pd.read_csv(filePath)
+    df = pd.read_csv(filePath, usecols=DATA_COLUMNS, dtype=DATA_DTYPES)
     # Rename columns to make more sense
     df = df.rename(columns={
         'Entity': 'Country',
-        'Total annual CO₂ emissions from aviation': 'Emissions'
+        EMISSIONS_COLUMN: 'Emissions'
         })
     return df
 
@@ -70,17 +77,18 @@ def cleanData(df):
     Returns:
         pandas.DataFrame: Cleaned DataFrame containing only country-level data with valid emissions.
     """
-    # Basic cleaning: drop rows with missing information
-    df = df.dropna(subset=['Emissions'])
-    df = df[df['Emissions'] > 0]
-
-    # Remove aggregated data for world and regions 
-    # because it skews the calculations.
-    # Regions have NULL ISO code
-    df_no_world = df[df["Country"] != "World"].copy()
-    df_countries = df_no_world[df_no_world["Code"].notna()].copy()
+    # Basic cleaning: drop rows with missing information,
+    # and remove aggregated data for world and regions
+    # because it skews the calculations (regions have NULL ISO code).
+    # All conditions are combined into one mask so the frame is filtered once.
+    mask = (
+        df['Emissions'].notna()
+        & (df['Emissions'] > 0)
+        & (df['Country'] != 'World')
+        & df['Code'].notna()
+    )
 
-    return df_countries
+    return df.loc[mask].reset_index(drop=True)
 
 
 def analyzeData(df):
@@ -96,16 +104,18 @@ def analyzeData(df):
     Returns:
         None
     """
-    print(df.describe())
+    print(df.describe().to_string())
     print("\n")
+    # Years are few, so group in order of appearance and sort the small result instead
     per_year_stats = (
-        df.groupby("Year")["Emissions"]
+        df.groupby("Year", sort=False, observed=True)["Emissions"]
         .agg(mean="mean", median="median", count="size")
+        .sort_index()
         .reset_index()
     )
 
     print("Emissions per year statistics:")
-    print(per_year_stats)
+    print(per_year_stats.to_string())
 
 
 def visualizeData(df):